@@ -6,6 +6,9 @@ in the worker program's logs (defaulting to "Report written to outputs/"), and
 then finishes the workflow by clicking a series of buttons. You can also set a
 working directory for the worker process when it lives in another folder.
 
+Excel files are parsed with python-calamine when it is installed and with pandas'
+default engine otherwise.
+
 Example usage (single command):
     python automation.py --excel-path ./inputs.xlsx --first-column "name" --second-column "email"
 
@@ -28,33 +31,44 @@ Extended usage:
         --final-buttons "#confirm,#done"
 """
 
+from __future__ import annotations
+
 import argparse
+import codecs
 import contextlib
+import functools
 import http.client
+import importlib.util
+import json
+import locale
+import os
+import shlex
+import signal
+import sys
 import threading
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 import subprocess
 
-import pandas as pd
-from selenium import webdriver
-from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+# pandas, numpy, openpyxl and selenium are imported where they are used so that
+# argument parsing (including --help) does not pay for loading them.
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from selenium import webdriver
+    from selenium.webdriver.support.ui import WebDriverWait
 
 
 def launch_worker(
-    command: str, completion_marker: str | None, log_path: Path | None, cwd: Path | None = None
+    command: str | list[str], completion_marker: str | None, log_path: Path | None, cwd: Path | None = None
 ):
     """Start the worker process and stream its output.
 
     Args:
-        command: The shell command to run for the worker program.
+        command: The command line (or argv list) to run for the worker program. It is
+            executed directly rather than through a shell.
         completion_marker: Marker string that indicates completion when found in stdout.
         log_path: Optional path to write the streamed logs.
 
@@ -62,28 +76,56 @@ def launch_worker(
         A tuple of (Popen, completion_event, streaming_thread).
     """
 
+    # Windows parses the command line itself; POSIX needs an argv list.
+    if isinstance(command, str) and os.name != "nt":
+        command = shlex.split(command)
+
     process = subprocess.Popen(
         command,
-        shell=True,
+        shell=False,
+        start_new_session=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
+        bufsize=0,
         cwd=str(cwd) if cwd else None,
     )
 
     completion_event = threading.Event()
+    # Match the encoding text-mode pipes would have decoded the worker output with.
+    encoding = locale.getpreferredencoding(False)
+    marker_bytes = completion_marker.encode(encoding) if completion_marker else b""
+
+    # Keeps partial multibyte sequences across chunks for the text-only echo path.
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    def _echo(chunk: bytes, final: bool = False):
+        # sys.stdout may be a text-only replacement (IDE consoles, captured output).
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        if stdout_buffer is None:
+            sys.stdout.write(decoder.decode(chunk, final))
+            sys.stdout.flush()
+            return
+        stdout_buffer.write(chunk)
+        stdout_buffer.flush()
 
     def _stream_output():
         with contextlib.ExitStack() as stack:
-            log_file = stack.enter_context(log_path.open("w")) if log_path else None
+            log_file = stack.enter_context(log_path.open("wb")) if log_path else None
             assert process.stdout is not None
-            for line in process.stdout:
-                print(line, end="")
+            fd = process.stdout.fileno()
+            # Keep the last len(marker) - 1 bytes so markers split across chunks are found.
+            keep = max(len(marker_bytes) - 1, 0)
+            tail = b""
+            while chunk := os.read(fd, 65536):
+                _echo(chunk)
                 if log_file:
-                    log_file.write(line)
-                if completion_marker and completion_marker in line:
-                    completion_event.set()
+                    log_file.write(chunk)
+                if marker_bytes and not completion_event.is_set():
+                    buf = tail + chunk
+                    if buf.find(marker_bytes) >= 0:
+                        completion_event.set()
+                    tail = buf[-keep:] if keep else b""
+            _echo(b"", final=True)
             process.stdout.close()
 
     thread = threading.Thread(target=_stream_output, daemon=True)
@@ -91,10 +133,35 @@ def launch_worker(
     return process, completion_event, thread
 
 
+def stop_worker(process: subprocess.Popen):
+    """Terminate the worker and any children it started in its session."""
+
+    if hasattr(os, "killpg"):
+        # The worker leads its own session, so its pid is also the process group id.
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(process.pid, signal.SIGTERM)
+    else:
+        process.terminate()
+    with contextlib.suppress(subprocess.TimeoutExpired):
+        process.wait(timeout=5)
+
+
 def build_driver(headless: bool) -> webdriver.Chrome:
-    """Create a Chrome WebDriver instance."""
+    """Create a Chrome WebDriver instance.
+
+    Pages are considered loaded once the DOM is ready and images are not fetched,
+    since the workflow only interacts with form fields and buttons.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
     options = Options()
+    options.page_load_strategy = "eager"
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     options.add_argument("--window-size=1400,900")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-gpu")
     if headless:
         options.add_argument("--headless=new")
     service = Service()
@@ -123,150 +190,454 @@ def _is_service_available(url: str, timeout: int) -> bool:
             conn.close()
 
 
-def wait_for_service(url: str, timeout: int, interval: float = 1.0) -> bool:
-    """Poll a URL until it responds or the timeout elapses."""
+def wait_for_service(url: str, timeout: int, initial_delay: float = 0.25, max_delay: float = 5.0) -> bool:
+    """Poll a URL with exponential backoff until it responds or the timeout elapses."""
 
     deadline = time.time() + timeout
+    delay = initial_delay
     while time.time() < deadline:
         if _is_service_available(url, timeout=timeout):
             return True
-        time.sleep(interval)
+        time.sleep(max(0.0, min(delay, max_delay, deadline - time.time())))
+        delay *= 2
     return False
 
 
-def _normalize_key(value: str) -> str:
-    return value.strip().lower()
+def _read_excel(path: Path, columns: tuple[str, ...]) -> pd.DataFrame:
+    """Read an Excel sheet with the calamine engine when python-calamine is installed.
+
+    python-calamine parses XLSX several times faster than openpyxl but is an optional
+    dependency (and needs pandas 2.2+), so pandas picks its default engine when it is
+    not available. Only
+    ``columns`` are parsed and their values are kept as text; absent columns are
+    skipped so callers can report them.
+    """
+
+    import pandas as pd
+
+    kwargs = {"usecols": lambda name: name in columns, "dtype": str}
+    if "calamine" in pd.ExcelFile._engines and importlib.util.find_spec("python_calamine") is not None:
+        kwargs["engine"] = "calamine"
+    return pd.read_excel(path, **kwargs)
+
+
+def _read_excel_with_sidecar(path: Path, columns: tuple[str, ...]) -> pd.DataFrame:
+    """Read an Excel file through a Parquet sidecar stored next to it.
+
+    The sidecar is used while it is at least as new as the workbook and holds the
+    requested columns; otherwise the workbook is parsed and the sidecar rewritten.
+    Sidecar failures (for example when pyarrow is not installed) fall back to parsing
+    the workbook.
+    """
+
+    import pandas as pd
+
+    sidecar = path.with_suffix(".parquet")
+    try:
+        if sidecar.stat().st_mtime >= path.stat().st_mtime:
+            df = pd.read_parquet(sidecar, engine="pyarrow")
+            if set(columns).issubset(df.columns):
+                return df
+    except (ImportError, OSError, ValueError):
+        pass
+
+    df = _read_excel(path, columns)
+    with contextlib.suppress(ImportError, OSError, TypeError, ValueError):
+        df.to_parquet(sidecar, engine="pyarrow")
+    return df
 
 
 def build_link_map(link_excel_path: Path, name_column: str, domain_column: str) -> dict[str, str]:
     """Load link groups into a lookup of normalized name -> domain string."""
 
-    df = pd.read_excel(link_excel_path)
+    df = _read_excel_with_sidecar(link_excel_path, (name_column, domain_column))
     if name_column not in df.columns or domain_column not in df.columns:
         raise ValueError(
             f"Missing required columns '{name_column}' or '{domain_column}' in {link_excel_path}"
         )
 
-    link_map: dict[str, str] = {}
-    for _, row in df.iterrows():
-        raw_name = row[name_column]
-        if pd.isna(raw_name):
-            continue
+    present = df[name_column].notna()
+    names = df.loc[present, name_column].astype(str).str.strip().str.lower()
+    domains = df.loc[present, domain_column].fillna("").astype(str)
+    return dict(zip(names.tolist(), domains.tolist()))
 
-        normalized_name = _normalize_key(str(raw_name))
-        domain_value = row[domain_column]
-        link_map[normalized_name] = "" if pd.isna(domain_value) else str(domain_value)
-    return link_map
 
+class ExcelSource:
+    """Topic sheet loaded once and shared between row iteration and status updates."""
 
-def read_excel_rows(
-    excel_path: Path,
-    first_column: str,
-    second_column: str,
-    link_map: dict[str, str] | None = None,
-    split_delimiter: str = ",",
-):
-    """Yield (index, first_value, second_value) from the specified Excel columns.
+    def __init__(self, excel_path: Path, first_column: str, second_column: str):
+        self.path = excel_path
+        self.first_column = first_column
+        self.second_column = second_column
+        # No Parquet sidecar here: status updates rewrite this workbook, so one would
+        # always be stale.
+        self.df = _read_excel(excel_path, (first_column, second_column))
+        if first_column not in self.df.columns or second_column not in self.df.columns:
+            raise ValueError(
+                f"Missing required columns '{first_column}' or '{second_column}' in {excel_path}"
+            )
 
-    When a link map is provided, values in the second column can be comma-separated
-    group names. Each group will emit its own tuple with the mapped domain string,
-    enabling scenarios like running both consulting and academic domain queries for
-    a single topic row.
-    """
+    def iter_rows(self, link_map: dict[str, str] | None = None, split_delimiter: str = ","):
+        """Yield (position, first_value, second_value) from the configured columns.
 
-    df = pd.read_excel(excel_path)
-    if first_column not in df.columns or second_column not in df.columns:
-        raise ValueError(
-            f"Missing required columns '{first_column}' or '{second_column}' in {excel_path}"
-        )
+        ``position`` is the zero-based row number in ``df``.
+
+        When a link map is provided, values in the second column can be comma-separated
+        group names. Each group will emit its own tuple with the mapped domain string,
+        enabling scenarios like running both consulting and academic domain queries for
+        a single topic row.
+        """
 
-    for idx, row in df.iterrows():
-        first_value = row[first_column]
-        first_text = "" if pd.isna(first_value) else str(first_value)
-        raw_second = row[second_column]
+        import numpy as np
+        import pandas as pd
+
+        first_col = self.df[self.first_column].fillna("").astype(str).to_numpy()
+        second_series = self.df[self.second_column].fillna("").astype(str)
 
         if link_map is None:
-            second_text = "" if pd.isna(raw_second) else str(raw_second)
-            yield idx, first_text, second_text
-            continue
+            yield from zip(range(len(first_col)), first_col, second_series.to_numpy())
+            return
+
+        # One entry per non-empty group name, indexed by the row position it came from.
+        tokens = (
+            second_series.str.split(split_delimiter, regex=False)
+            .set_axis(range(len(second_series)))
+            .explode()
+            .str.strip()
+        )
+        tokens = tokens[tokens != ""]
+        mapped = tokens.str.lower().map(link_map)
+        values = pd.Series(np.where(mapped.isna(), tokens, mapped), index=tokens.index)
 
-        if pd.isna(raw_second):
-            yield idx, first_text, ""
-            continue
+        # Rows without any group name keep their raw text.
+        ungrouped = np.flatnonzero(~np.isin(np.arange(len(second_series)), tokens.index))
+        fallback = pd.Series(second_series.to_numpy()[ungrouped], index=ungrouped)
 
-        groups = [group.strip() for group in str(raw_second).split(split_delimiter) if group.strip()]
-        if not groups:
-            yield idx, first_text, str(raw_second)
-            continue
+        output = pd.concat([values, fallback]).sort_index(kind="stable")
+        positions = output.index.to_numpy()
+        yield from zip(positions.tolist(), first_col[positions], output.to_numpy())
 
-        for group in groups:
-            mapped_value = link_map.get(_normalize_key(group))
-            yield idx, first_text, mapped_value if mapped_value is not None else group
+
+# Workbook formats openpyxl can open and save in place.
+_OPENPYXL_SUFFIXES = {".xlsx", ".xlsm", ".xltx", ".xltm"}
 
 
 def write_status_updates(
     excel_path: Path,
-    processed_indices: list,
+    processed: np.ndarray,
     status_column: str,
     status_value: str,
     output_excel: Path | None = None,
 ):
-    """Mark processed rows in the Excel file with a status value."""
+    """Mark processed rows in the Excel file with a status value.
 
-    if not processed_indices:
-        return
+    ``processed`` is a boolean mask over the sheet's data rows, as read by
+    ``ExcelSource``. Only the status cells are written into the existing workbook, so
+    other columns, formulas and styling are preserved. Other formats (e.g. ``.ods``)
+    are rewritten from a full DataFrame.
+    """
 
-    df = pd.read_excel(excel_path)
-    if status_column not in df.columns:
-        df[status_column] = ""
+    import numpy as np
+    import pandas as pd
+    from openpyxl import load_workbook
 
-    df.loc[processed_indices, status_column] = status_value
+    if not processed.any():
+        return
 
     target_path = output_excel if output_excel else excel_path
-    df.to_excel(target_path, index=False)
+    suffixes = {excel_path.suffix.lower(), target_path.suffix.lower()}
+    if not suffixes <= _OPENPYXL_SUFFIXES:
+        full_df = pd.read_excel(excel_path)
+        if status_column not in full_df.columns:
+            full_df[status_column] = ""
+        full_df.loc[processed, status_column] = status_value
+        full_df.to_excel(target_path, index=False)
+        return
+
+    workbook = load_workbook(excel_path)
+    sheet = workbook.worksheets[0]
+
+    header: dict[object, int] = {}
+    for cell in sheet[1]:
+        header.setdefault(cell.value, cell.column)
+    status_col = header.get(status_column)
+    if status_col is None:
+        status_col = sheet.max_column + 1
+        sheet.cell(row=1, column=status_col, value=status_column)
+
+    # Data starts on the row after the header.
+    for position in np.flatnonzero(processed).tolist():
+        sheet.cell(row=position + 2, column=status_col, value=status_value)
+
+    workbook.save(target_path)
+
+
+_FILL_HELPERS_JS = """
+function isVisible(element) {
+    if (typeof element.checkVisibility === "function") {
+        return element.checkVisibility({visibilityProperty: true, opacityProperty: true});
+    }
+    const style = window.getComputedStyle(element);
+    return element.getClientRects().length > 0
+        && style.visibility !== "hidden"
+        && style.opacity !== "0";
+}
+
+function isFillable(element) {
+    // Mirror element_to_be_clickable plus send_keys: present, visible, enabled and
+    // editable. Other element types (e.g. contenteditable) are left to the WebDriver
+    // path.
+    return element !== null
+        && (element.tagName === "INPUT" || element.tagName === "TEXTAREA")
+        && !element.disabled
+        && !element.readOnly
+        && isVisible(element);
+}
+
+function setValue(element, value) {
+    // Use the native setter so frameworks that track the input value see the change.
+    const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value");
+    if (descriptor && descriptor.set) {
+        descriptor.set.call(element, value);
+    } else {
+        element.value = value;
+    }
+    element.dispatchEvent(new Event("input", {bubbles: true}));
+    element.dispatchEvent(new Event("change", {bubbles: true}));
+}
+
+function submitForm(form, cancelUnhandled) {
+    // Returns true when a page handler cancelled the native submission, i.e. the page
+    // handled it in script. With cancelUnhandled, a submission the page left alone is
+    // cancelled so it cannot navigate away.
+    let handled = false;
+    const listener = (event) => {
+        handled = event.defaultPrevented;
+        if (!handled && cancelUnhandled) {
+            event.preventDefault();
+        }
+    };
+    window.addEventListener("submit", listener);
+    try {
+        form.requestSubmit();
+    } finally {
+        window.removeEventListener("submit", listener);
+    }
+    return handled;
+}
+
+function pressEnter(element, cancelUnhandled) {
+    // Returns true when the page handled the Enter press or the form submission.
+    const init = {key: "Enter", code: "Enter", keyCode: 13, which: 13, bubbles: true, cancelable: true};
+    const keyHandled = !element.dispatchEvent(new KeyboardEvent("keydown", init));
+    const pressHandled = !element.dispatchEvent(new KeyboardEvent("keypress", init));
+    let submitHandled = false;
+    // Synthetic key events do not trigger implicit form submission, so do it here.
+    // Enter in a textarea inserts a newline rather than submitting.
+    if (!keyHandled && element.form && element.tagName === "INPUT") {
+        submitHandled = submitForm(element.form, cancelUnhandled);
+    }
+    const upHandled = !element.dispatchEvent(new KeyboardEvent("keyup", init));
+    return keyHandled || pressHandled || submitHandled || upHandled;
+}
+
+function fillRow(firstSelector, secondSelector, submitSelector, firstValue, secondValue, cancelUnhandled) {
+    // Returns "unavailable" when the fields cannot be driven from script, otherwise
+    // "handled" or "unhandled" depending on whether the page handled the submission.
+    const first = document.querySelector(firstSelector);
+    const second = document.querySelector(secondSelector);
+    const submit = document.querySelector(submitSelector);
+    if (!isFillable(first) || !isFillable(second) || !isFillable(submit)) {
+        return "unavailable";
+    }
+    setValue(first, firstValue);
+    setValue(second, secondValue);
+    submit.focus();
+    return pressEnter(submit, cancelUnhandled) ? "handled" : "unhandled";
+}
+"""
+
+_FILL_JS = _FILL_HELPERS_JS + 'return fillRow(...arguments, false) !== "unavailable";'
+
+_BATCH_JS = _FILL_HELPERS_JS + """
+const [payload, firstSelector, secondSelector, submitSelector] = arguments;
+const done = arguments[arguments.length - 1];
+const rows = JSON.parse(payload);
+let submitted = 0;
+// Progress and a stop flag live on the page so the caller can halt the chain and
+// read back how far it got if this script call fails.
+window.__batchSubmitted = 0;
+window.__batchStop = false;
+
+// Yield to the event loop between rows so the page can react to each submission.
+// A row only counts once the page has handled its submission in script; anything
+// else (including a native submission, which is cancelled) ends the batch.
+function step() {
+    try {
+        if (!window.__batchStop
+            && submitted < rows.length
+            && fillRow(
+                firstSelector, secondSelector, submitSelector, rows[submitted].a, rows[submitted].b, true
+            ) === "handled") {
+            submitted += 1;
+            window.__batchSubmitted = submitted;
+            setTimeout(step, 0);
+            return;
+        }
+    } catch (error) {
+        // Report what was submitted so far; the caller handles the rest row by row.
+    }
+    done(submitted);
+}
+step();
+"""
 
 
-def fill_fields(driver: webdriver.Chrome, first_locator, second_locator, submit_locator, first_value: str, second_value: str):
-    """Populate form fields and submit."""
-    wait = WebDriverWait(driver, 10)
+@functools.lru_cache(maxsize=None)
+def _clickable(locator: tuple[str, str]):
+    """Return a shared element_to_be_clickable condition for the locator."""
+    from selenium.webdriver.support import expected_conditions as EC
+
+    return EC.element_to_be_clickable(locator)
+
+
+def fill_fields(
+    driver: webdriver.Chrome,
+    wait: WebDriverWait,
+    first_locator,
+    second_locator,
+    submit_locator,
+    first_value: str,
+    second_value: str,
+):
+    """Populate form fields and submit.
 
-    first_input = wait.until(EC.element_to_be_clickable(first_locator))
+    The fields are filled and submitted with a single script call. When any of them is
+    missing, hidden, disabled or not an input/textarea (for example while the page is
+    still processing the previous row), wait for them to become clickable and type
+    into them instead.
+    """
+    if driver.execute_script(
+        _FILL_JS, first_locator[1], second_locator[1], submit_locator[1], first_value, second_value
+    ):
+        return
+
+    from selenium.webdriver.common.keys import Keys
+
+    first_input = wait.until(_clickable(first_locator))
     first_input.clear()
     first_input.send_keys(first_value)
 
-    second_input = wait.until(EC.element_to_be_clickable(second_locator))
+    second_input = wait.until(_clickable(second_locator))
     second_input.clear()
     second_input.send_keys(second_value)
 
-    submit_element = wait.until(EC.element_to_be_clickable(submit_locator))
+    submit_element = wait.until(_clickable(submit_locator))
     submit_element.send_keys(Keys.ENTER)
 
 
+def fill_rows_batch(
+    driver: webdriver.Chrome, first_locator, second_locator, submit_locator, rows: list[tuple]
+) -> int:
+    """Fill and submit ``(position, first_value, second_value)`` rows inside the browser.
+
+    All rows are sent as one JSON payload and submitted by a single async script. This
+    only suits single-page apps that handle the submission in script: a row counts as
+    submitted once a page handler has cancelled the native form submission (or the
+    Enter key event), and the batch stops at the first row that is not handled that
+    way. Returns how many leading rows were submitted, leaving the rest to
+    ``fill_fields``.
+
+    If the script call fails (e.g. a script timeout), the in-page loop is stopped and
+    its recorded progress is returned. When that progress cannot be read back, a
+    RuntimeError is raised rather than replaying rows that may already be submitted.
+    """
+
+    from selenium.common.exceptions import WebDriverException
+
+    if not rows:
+        return 0
+    payload = json.dumps([{"a": first_value, "b": second_value} for _, first_value, second_value in rows])
+    driver.set_script_timeout(30 + len(rows))
+    try:
+        submitted = driver.execute_async_script(
+            _BATCH_JS, payload, first_locator[1], second_locator[1], submit_locator[1]
+        )
+    except WebDriverException as exc:
+        try:
+            submitted = driver.execute_script("window.__batchStop = true; return window.__batchSubmitted;")
+        except WebDriverException:
+            submitted = None
+        if submitted is None:
+            raise RuntimeError(
+                "Batch submission was interrupted and the number of submitted rows is unknown; "
+                "not replaying rows to avoid duplicate submissions."
+            ) from exc
+    return int(submitted or 0)
+
+
 def wait_for_completion(
     driver: webdriver.Chrome, condition, process_event: threading.Event | None, timeout: int
 ):
-    """Wait until either the DOM condition is met or the worker signals completion."""
-
-    def _either(driver_obj):
-        if process_event and process_event.is_set():
-            return "process"
-        result = condition(driver_obj)
-        if result:
-            return "dom"
-        return False
-
-    return WebDriverWait(driver, timeout, poll_frequency=1).until(_either)
+    """Wait until either the DOM condition is met or the worker signals completion.
 
+    The DOM and the worker event are watched on separate threads that signal a shared
+    event, so a worker completion is picked up immediately instead of on the next DOM
+    poll. Returns "process" or "dom" depending on which finished first.
+    """
 
-def finish_workflow(driver: webdriver.Chrome, button_locators: list[tuple[str, str]]):
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    done_event = threading.Event()
+    results: list[str] = []
+    errors: list[WebDriverException] = []
+
+    def _watch_dom():
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+                lambda driver_obj: done_event.is_set() or condition(driver_obj)
+            )
+            results.append("dom")
+        except TimeoutException:
+            pass
+        except WebDriverException as exc:
+            errors.append(exc)
+        finally:
+            done_event.set()
+
+    def _watch_process():
+        if process_event.wait(timeout):
+            results.append("process")
+            done_event.set()
+
+    dom_thread = threading.Thread(target=_watch_dom, daemon=True)
+    dom_thread.start()
+    if process_event:
+        threading.Thread(target=_watch_process, daemon=True).start()
+
+    done_event.wait(timeout)
+    # Stop the DOM watcher and let it finish before the driver is used again.
+    done_event.set()
+    dom_thread.join()
+
+    if results:
+        return results[0]
+    if errors:
+        raise errors[0]
+    raise TimeoutException(f"Completion was not detected within {timeout} seconds.")
+
+
+def finish_workflow(driver: webdriver.Chrome, wait: WebDriverWait, button_locators: list[tuple[str, str]]):
     """Click additional buttons to complete the workflow."""
-    wait = WebDriverWait(driver, 10)
     for locator in button_locators:
-        button = wait.until(EC.element_to_be_clickable(locator))
+        button = wait.until(_clickable(locator))
         button.click()
 
 
 def css_locator(selector: str):
+    from selenium.webdriver.common.by import By
+
     return (By.CSS_SELECTOR, selector)
 
 
@@ -388,6 +759,14 @@ def parse_args():
         default=40,
         help="Seconds to wait for the target URL to start responding before launching the browser.",
     )
+    parser.add_argument(
+        "--batch-submit",
+        action="store_true",
+        help=(
+            "Submit all rows with one in-browser script before falling back to row-by-row entry. "
+            "Only for single-page apps that handle the form submission in JavaScript."
+        ),
+    )
     parser.add_argument("--headless", action="store_true", help="Run Chrome in headless mode.")
     return parser.parse_args()
 
@@ -395,6 +774,11 @@ def parse_args():
 def main():
     args = parse_args()
 
+    import numpy as np
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     process = None
     completion_event = None
     stream_thread = None
@@ -406,9 +790,7 @@ def main():
 
     if not wait_for_service(args.url, args.service_wait):
         if process:
-            process.terminate()
-            with contextlib.suppress(subprocess.TimeoutExpired):
-                process.wait(timeout=5)
+            stop_worker(process)
         raise RuntimeError(
             "The target service did not respond within the allotted time. "
             "Start the web app (or set --url to a reachable address) before running this script."
@@ -420,9 +802,7 @@ def main():
     except WebDriverException as exc:
         driver.quit()
         if process:
-            process.terminate()
-            with contextlib.suppress(subprocess.TimeoutExpired):
-                process.wait(timeout=5)
+            stop_worker(process)
         raise RuntimeError(
             f"Failed to open {args.url}. Ensure the target service is running or provide a reachable --url."
         ) from exc
@@ -437,38 +817,36 @@ def main():
         completion_condition = EC.text_to_be_present_in_element(completion_locator, args.completion_text)
 
     button_locators = parse_button_selectors(args.final_buttons)
+    wait = WebDriverWait(driver, 10, poll_frequency=0.25)
 
     link_map = None
     if args.link_excel_path:
         link_map = build_link_map(args.link_excel_path, args.link_name_column, args.link_domain_column)
 
-    processed_indices: set[int] = set()
-
     try:
-        for idx, first_value, second_value in read_excel_rows(
-            args.excel_path,
-            args.first_column,
-            args.second_column,
-            link_map=link_map,
-            split_delimiter=args.link_delimiter,
-        ):
-            fill_fields(driver, first_locator, second_locator, submit_locator, first_value, second_value)
-            processed_indices.add(idx)
+        source = ExcelSource(args.excel_path, args.first_column, args.second_column)
+        rows = list(source.iter_rows(link_map=link_map, split_delimiter=args.link_delimiter))
+        submitted = 0
+        if args.batch_submit:
+            submitted = fill_rows_batch(driver, first_locator, second_locator, submit_locator, rows)
+        processed = np.zeros(len(source.df), dtype=bool)
+        processed[[position for position, _, _ in rows[:submitted]]] = True
+        for position, first_value, second_value in rows[submitted:]:
+            fill_fields(driver, wait, first_locator, second_locator, submit_locator, first_value, second_value)
+            processed[position] = True
 
         wait_for_completion(driver, completion_condition, completion_event, args.timeout)
-        finish_workflow(driver, button_locators)
+        finish_workflow(driver, wait, button_locators)
         write_status_updates(
-            args.excel_path,
-            sorted(processed_indices),
+            source.path,
+            processed,
             args.status_column,
             args.status_value,
             args.output_excel,
         )
     finally:
         if process:
-            process.terminate()
-            with contextlib.suppress(subprocess.TimeoutExpired):
-                process.wait(timeout=5)
+            stop_worker(process)
         driver.quit()
         if stream_thread:
             stream_thread.join(timeout=1)